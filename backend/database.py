@@ -1,13 +1,45 @@
+import hashlib
+import json
 import logging
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from .env import DATABASE_URL
+from .env import DATABASE_URL, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_SIZE
+
+try:  # pragma: no cover - optional faster codec for JSON columns
+    import orjson
+except Exception:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-engine = create_engine(DATABASE_URL)
+
+def _orjson_dumps(value) -> str:
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:  # e.g. integers beyond 64 bits, which json accepts
+        return json.dumps(value)
+
+
+# Reads stay on json.loads: orjson.loads turns integers beyond 64 bits into
+# floats, silently losing precision.
+_json_kwargs = {"json_serializer": _orjson_dumps} if orjson is not None else {}
+
+# Keep a warm pool of long-lived connections for server databases; pre-ping
+# drops connections the server closed while idle. SQLite keeps its defaults.
+_pool_kwargs = (
+    {}
+    if (DATABASE_URL or "").startswith("sqlite")
+    else {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+)
+
+engine = create_engine(DATABASE_URL, **_json_kwargs, **_pool_kwargs)
 
 SessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
@@ -24,3 +56,63 @@ def get_db():
     finally:
         db.close()
         logger.debug("Database session closed")
+
+
+# Indexes once declared on the models and since removed. create_all never
+# drops anything, so databases created before the removal still carry them.
+_OBSOLETE_INDEXES = ("ix_newsletter_id", "ix_sec_filing_id")
+
+
+def _schema_hash() -> str:
+    """Return a digest of every table, column, constraint and index in ``Base``."""
+    shape = sorted(
+        (
+            table.name,
+            [(c.name, repr(c.type), c.nullable) for c in table.columns],
+            sorted(
+                (type(c).__name__, c.name or "", sorted(col.name for col in c.columns))
+                for c in table.constraints
+            ),
+            sorted(fk.target_fullname for fk in table.foreign_keys),
+            sorted(i.name or "" for i in table.indexes),
+        )
+        for table in Base.metadata.sorted_tables
+    )
+    return hashlib.sha256(repr(shape).encode()).hexdigest()
+
+
+def create_tables(force: bool = False) -> None:
+    """Create missing tables unless the stored schema hash is already current.
+
+    ``metadata.create_all`` checks every table on each boot; recording a hash
+    of the model definitions in ``_schema_version`` reduces an unchanged
+    startup to a hash lookup plus a table listing. Tables dropped by hand are
+    noticed and recreated; pass ``force=True`` to re-create indexes dropped
+    by hand, since the hash only tracks the models.
+    """
+    schema_hash = _schema_hash()
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE TABLE IF NOT EXISTS _schema_version (hash VARCHAR(64) NOT NULL)")
+        )
+        stored = conn.execute(text("SELECT hash FROM _schema_version")).scalar()
+        missing = {t.name for t in Base.metadata.sorted_tables} - set(
+            inspect(conn).get_table_names()
+        )
+        if stored == schema_hash and not missing and not force:
+            logger.debug("Schema hash unchanged; skipping create_all")
+            return
+        Base.metadata.create_all(bind=conn)
+        # create_all skips tables that already exist, so indexes added to a
+        # model later have to be created explicitly.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        for name in _OBSOLETE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        conn.execute(text("DELETE FROM _schema_version"))
+        conn.execute(
+            text("INSERT INTO _schema_version (hash) VALUES (:hash)"),
+            {"hash": schema_hash},
+        )
+    logger.info("Schema created/updated (hash %s)", schema_hash[:12])
@@ -12,6 +12,9 @@ def _as_list(value: str | None):
 
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
 GMAIL_SCOPE = os.getenv("GMAIL_SCOPE")
 FASTAPI_PORT = int(os.getenv("FASTAPI_PORT", os.getenv("PORT", "8000")))
 MODEL_IN_USE = os.getenv("MODEL_IN_USE", "gpt-3.5-turbo")
@@ -7,8 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRoute
 from sqlalchemy import text
 
-from . import models
-from .database import engine
+from . import models  # noqa: F401 - registers tables on Base.metadata
+from .database import create_tables, engine
 from .env import CORS_ALLOW_ORIGINS, FASTAPI_PORT, GMAIL_SCOPE, LOG_LEVEL
 from .routers import ingest, query, stocks  # Adjust if needed
 from .services.email_service import get_authenticated_gmail_service
@@ -46,12 +46,12 @@ async def lifespan(app: FastAPI):
     # Database setup
     try:
         logger.info("Connecting to DB for schema update...")
-        models.Base.metadata.create_all(bind=engine)
+        create_tables()
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
         logger.info("Schema update successful and connection verified.")
     except Exception as e:
-        logger.exception(f"Schema update failed: {e}")
+        logger.exception("Schema update failed: %s", e)
 
     yield
     # Optional: any shutdown logic here
@@ -84,7 +84,7 @@ def root():
 # ----- Log Routes -----
 for route in app.routes:
     if isinstance(route, APIRoute):
-        logger.info(f"Route registered: {route.path} -> {route.methods}")
+        logger.info("Route registered: %s -> %s", route.path, route.methods)
 
 # ----- Uvicorn Entry Point -----
 if __name__ == "__main__":
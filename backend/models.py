@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, String, DateTime, JSON, Boolean, func
+from sqlalchemy import Column, Integer, Text, String, DateTime, JSON, Boolean, Index, func
 from .database import Base  # assumes you have a `Base = declarative_base()` in `database.py`
 
 
@@ -6,7 +6,7 @@ from .database import Base  # assumes you have a `Base = declarative_base()` in
 class Newsletter(Base):
     __tablename__ = "newsletter"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(Text, nullable=False)
     category = Column(String, nullable=True)
     sender = Column(String, nullable=False)
@@ -18,13 +18,19 @@ class Newsletter(Base):
     created_at = Column(DateTime, server_default=func.now())
     vectorized = Column(Boolean, default=False)
 
+    # Listing endpoints filter by category and always sort newest first.
+    __table_args__ = (
+        Index("ix_newsletter_cat_received", category, received_at.desc()),
+        Index("ix_newsletter_received", received_at.desc()),
+    )
+
 
 class SecFiling(Base):
     """Model storing metadata about fetched SEC filings."""
 
     __tablename__ = "sec_filing"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     cik = Column(String, index=True, nullable=False)
     accession_number = Column(String, unique=True, nullable=False)
     form_type = Column(String, nullable=False)
@@ -1,9 +1,11 @@
 # app/routers/ingest.py
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy import Text, and_, cast, func
 from sqlalchemy.orm import Session
 import logging
 import json
+import time
 from datetime import datetime, timedelta, timezone
 from ..database import get_db
 from ..schemas import ApiResponse
@@ -11,6 +13,7 @@ from ..services.chunking import chunk_newsletter_text
 from ..services.cleaning import clean_bloomberg_newsletter
 from ..services.vector import embed_chunked_newsletter
 from ..services.token_counter import compute_token_count_simple
+from ..services.queries import get_newsletter
 from .. import main
 from ..models import Newsletter
 
@@ -25,6 +28,27 @@ from pathlib import Path
 router = APIRouter(tags=["Ingestion"])
 logger = logging.getLogger(__name__)
 
+# chunked_text is a JSON column: rows scanned but not yet chunked hold the JSON
+# literal null (not SQL NULL), so test the serialized form as well.
+_HAS_CHUNKS = and_(
+    Newsletter.chunked_text.isnot(None),
+    cast(Newsletter.chunked_text, Text).notin_(["null", "[]"]),
+)
+
+# The category list only changes when newsletters are stored or backfilled,
+# so /categories serves it from memory for a short TTL.
+CATEGORIES_TTL = 30.0
+_categories_cache: tuple[float, list[str]] | None = None
+# Bumped on every invalidation; a query that started before one must not
+# store its (possibly stale) result afterwards.
+_categories_generation = 0
+
+
+def _invalidate_categories() -> None:
+    global _categories_cache, _categories_generation
+    _categories_generation += 1
+    _categories_cache = None
+
 
 # ----- Status ------------------------------------------------------------
 @router.get("/gmail_status", response_model=ApiResponse)
@@ -32,13 +56,13 @@ def gmail_status():
     """Return whether the Gmail service is connected."""
     logger.info("Checking Gmail service connection status")
     connected = main.gmail_service is not None
-    logger.debug(f"Gmail connected: {connected}")
+    logger.debug("Gmail connected: %s", connected)
     return ApiResponse(success=True, data={"connected": connected})
 
 
 # retrieve
 @router.post("/bloomberg_reload", response_model=ApiResponse)
-async def reload_bloomberg_emails(db: Session = Depends(get_db)):
+def reload_bloomberg_emails(db: Session = Depends(get_db)):
     logger.info("Starting bloomberg_reload endpoint")
     try:
         if main.gmail_service is None:
@@ -47,10 +71,25 @@ async def reload_bloomberg_emails(db: Session = Depends(get_db)):
 
         logger.debug("Invoking scan_bloomberg_emails")
         stored = scan_bloomberg_emails(service=main.gmail_service, db=db)
-        logger.debug(f"scan_bloomberg_emails stored {len(stored)} new entries")
-
-        newsletters = db.query(Newsletter).order_by(Newsletter.received_at.desc()).all()
-        logger.debug(f"Retrieved {len(newsletters)} newsletters from DB")
+        logger.debug("scan_bloomberg_emails stored %s new entries", len(stored))
+        if stored:
+            _invalidate_categories()
+
+        # Only the listing columns; the text bodies reduce to server-side flags.
+        newsletters = (
+            db.query(
+                Newsletter.title,
+                Newsletter.message_id,
+                Newsletter.category,
+                Newsletter.received_at,
+                Newsletter.extracted_text.isnot(None).label("has_text"),
+                _HAS_CHUNKS.label("has_chunks"),
+                Newsletter.vectorized,
+            )
+            .order_by(Newsletter.received_at.desc())
+            .all()
+        )
+        logger.debug("Retrieved %s newsletters from DB", len(newsletters))
 
         payload = [
             {
@@ -58,8 +97,8 @@ async def reload_bloomberg_emails(db: Session = Depends(get_db)):
                 "message_id": n.message_id,
                 "category": n.category,
                 "received_at": n.received_at.isoformat() if n.received_at else None,
-                "has_text": n.extracted_text is not None,
-                "has_chunks": bool(n.chunked_text),
+                "has_text": bool(n.has_text),
+                "has_chunks": bool(n.has_chunks),
                 "vectorized": n.vectorized,
             }
             for n in newsletters
@@ -77,18 +116,23 @@ async def reload_bloomberg_emails(db: Session = Depends(get_db)):
 def get_newsletters_by_category(
     category: str = Query(...), db: Session = Depends(get_db)
 ):
-    logger.info(f"Filtering newsletters by category: {category}")
+    logger.info("Filtering newsletters by category: %s", category)
 
     def filter_newsletters_by_category(db: Session, category: str):
-        logger.debug(f"Querying DB for category: {category}")
+        logger.debug("Querying DB for category: %s", category)
         normalized = category.lower().replace(" ", "_")
         results = (
-            db.query(Newsletter)
+            db.query(
+                Newsletter.title,
+                Newsletter.message_id,
+                Newsletter.received_at,
+                Newsletter.category,
+            )
             .filter(Newsletter.category == normalized)
             .order_by(Newsletter.received_at.desc())
             .all()
         )
-        logger.debug(f"Found {len(results)} results for category: {normalized}")
+        logger.debug("Found %s results for category: %s", len(results), normalized)
 
         return [
             {
@@ -102,7 +146,7 @@ def get_newsletters_by_category(
 
     try:
         filtered = filter_newsletters_by_category(db=db, category=category)
-        logger.info(f"Returning {len(filtered)} filtered newsletters")
+        logger.info("Returning %s filtered newsletters", len(filtered))
         return ApiResponse(success=True, data=filtered)
     except Exception as e:
         logger.exception("Failed to filter newsletters by category")
@@ -112,7 +156,13 @@ def get_newsletters_by_category(
 @router.get("/categories", response_model=ApiResponse)
 def get_categories(db: Session = Depends(get_db)):
     """Return a list of distinct newsletter categories."""
+    global _categories_cache
     logger.info("Fetching unique newsletter categories")
+    cached = _categories_cache
+    if cached is not None and time.monotonic() - cached[0] < CATEGORIES_TTL:
+        logger.debug("Serving %d categories from cache", len(cached[1]))
+        return ApiResponse(success=True, data=cached[1])
+    generation = _categories_generation
     try:
         categories = (
             db.query(Newsletter.category)
@@ -122,6 +172,8 @@ def get_categories(db: Session = Depends(get_db)):
         )
         names = [c[0] for c in categories if c[0]]
         logger.debug("Found %d categories", len(names))
+        if generation == _categories_generation:
+            _categories_cache = (time.monotonic(), names)
         return ApiResponse(success=True, data=names)
     except Exception as e:
         logger.exception("Failed to fetch categories")
@@ -137,10 +189,18 @@ def filter_newsletters(
 ):
     """Filter newsletters by optional category and received date range (YYYY-MM-DD)."""
     logger.info(
-        f"Filtering newsletters category={category} start_date={start_date} end_date={end_date}"
+        "Filtering newsletters category=%s start_date=%s end_date=%s",
+        category,
+        start_date,
+        end_date,
     )
     try:
-        q = db.query(Newsletter)
+        q = db.query(
+            Newsletter.title,
+            Newsletter.message_id,
+            Newsletter.received_at,
+            Newsletter.category,
+        )
         if category:
             normalized = category.lower().replace(" ", "_")
             q = q.filter(Newsletter.category == normalized)
@@ -176,7 +236,7 @@ def filter_newsletters(
             }
             for n in results
         ]
-        logger.info(f"Returning {len(payload)} filtered newsletters")
+        logger.info("Returning %s filtered newsletters", len(payload))
         return ApiResponse(success=True, data=payload)
     except Exception as e:
         logger.exception("Failed to filter newsletters")
@@ -187,7 +247,7 @@ def filter_newsletters(
 @router.post("/extract_text/{message_id}", response_model=ApiResponse)
 def extract_bloomberg_content(message_id: str, db: Session = Depends(get_db)):
     """Extract plain text from a Bloomberg newsletter."""
-    logger.info(f"Extracting text for newsletter {message_id}")
+    logger.info("Extracting text for newsletter %s", message_id)
     try:
         if main.gmail_service is None:
             logger.error("Gmail service is not initialized")
@@ -197,10 +257,11 @@ def extract_bloomberg_content(message_id: str, db: Session = Depends(get_db)):
             service=main.gmail_service, db=db, message_id=message_id
         )
         if newsletter is None:
-            logger.warning(f"Extraction failed or no content for {message_id}")
+            logger.warning("Extraction failed or no content for %s", message_id)
             return ApiResponse(success=False, error="Extraction failed or no content.")
 
-        logger.info(f"Extraction succeeded for {message_id}")
+        logger.info("Extraction succeeded for %s", message_id)
+        _invalidate_categories()
         return ApiResponse(
             success=True,
             data={
@@ -218,14 +279,14 @@ def extract_bloomberg_content(message_id: str, db: Session = Depends(get_db)):
 
 @router.post("/chunk/{message_id}", response_model=ApiResponse)
 def chunk_newsletter(message_id: str, db: Session = Depends(get_db)):
-    logger.info(f"Chunking newsletter {message_id}")
+    logger.info("Chunking newsletter %s", message_id)
     newsletter = chunk_newsletter_text(db, message_id)
     if newsletter:
-        logger.info(f"Chunking succeeded for {message_id}")
+        logger.info("Chunking succeeded for %s", message_id)
         return ApiResponse(
             success=True, data={"message_id": message_id, "has_chunks": True}
         )
-    logger.error(f"Chunking failed for {message_id}")
+    logger.error("Chunking failed for %s", message_id)
     return ApiResponse(success=False, error="Chunking failed or prerequisites missing.")
 
 
@@ -233,21 +294,21 @@ def chunk_newsletter(message_id: str, db: Session = Depends(get_db)):
 @router.post("/embed/{message_id}", response_model=ApiResponse)
 def embed_newsletter(message_id: str, db: Session = Depends(get_db)):
     """Only embed if chunked_text exists and we have NOT already embedded."""
-    logger.info(f"Embedding newsletter {message_id}")
+    logger.info("Embedding newsletter %s", message_id)
     try:
-        newsletter = db.query(Newsletter).filter_by(message_id=message_id).first()
+        newsletter = get_newsletter(db, message_id)
         if not newsletter:
-            logger.error(f"Newsletter {message_id} not found")
+            logger.error("Newsletter %s not found", message_id)
             return ApiResponse(success=False, error="Newsletter not found.")
 
         if not newsletter.chunked_text:
-            logger.error(f"Chunked text missing for {message_id}")
+            logger.error("Chunked text missing for %s", message_id)
             return ApiResponse(
                 success=False, error="Chunked text missing. Run /chunk first."
             )
 
         if newsletter.vectorized:
-            logger.info(f"Newsletter {message_id} already vectorized in DB")
+            logger.info("Newsletter %s already vectorized in DB", message_id)
             return ApiResponse(
                 success=True,
                 data={
@@ -259,9 +320,9 @@ def embed_newsletter(message_id: str, db: Session = Depends(get_db)):
 
         db_obj = embed_chunked_newsletter(db, message_id)
         if not db_obj:
-            logger.error(f"Embedding failed for {message_id}")
+            logger.error("Embedding failed for %s", message_id)
             return ApiResponse(success=False, error="Embedding failed.")
-        logger.info(f"Embedding completed for {message_id}")
+        logger.info("Embedding completed for %s", message_id)
         return ApiResponse(
             success=True,
             data={"message_id": message_id, "embedded": True, "vectorized": True},
@@ -276,45 +337,58 @@ def embed_newsletter(message_id: str, db: Session = Depends(get_db)):
 @router.get("/raw_text/{message_id}", response_model=ApiResponse)
 def get_raw_text(message_id: str, db: Session = Depends(get_db)):
     """Return cleaned and chunked text for a newsletter."""
-    logger.info(f"Fetching raw text for {message_id}")
-    newsletter = db.query(Newsletter).filter_by(message_id=message_id).first()
-    if not newsletter or not newsletter.extracted_text:
-        logger.warning(f"No text available for {message_id}")
+    logger.info("Fetching raw text for %s", message_id)
+    row = (
+        db.query(
+            (func.length(Newsletter.extracted_text) > 0).label("has_text"),
+            Newsletter.chunked_text,
+        )
+        .filter(Newsletter.message_id == message_id)
+        .first()
+    )
+    if not row or not row.has_text:
+        logger.warning("No text available for %s", message_id)
         return ApiResponse(success=False, error="Text not available")
 
-    if not newsletter.chunked_text:
+    chunks = row.chunked_text
+    if not chunks:
         logger.debug("Chunked text missing; generating now")
         newsletter = chunk_newsletter_text(db, message_id)
         if not newsletter:
-            logger.error(f"Chunking failed for {message_id}")
+            logger.error("Chunking failed for %s", message_id)
             return ApiResponse(success=False, error="Chunking failed")
+        chunks = newsletter.chunked_text
 
-    logger.debug(f"Returning {len(newsletter.chunked_text)} chunks")
-    return ApiResponse(success=True, data={"chunks": newsletter.chunked_text})
+    logger.debug("Returning %s chunks", len(chunks))
+    return ApiResponse(success=True, data={"chunks": chunks})
 
 
 @router.get("/chunked_text/{message_id}", response_model=ApiResponse)
 def get_chunked_text(message_id: str, db: Session = Depends(get_db)):
     """Return stored chunked text for a newsletter."""
-    logger.info(f"Fetching chunked text for {message_id}")
-    n = db.query(Newsletter).filter_by(message_id=message_id).first()
-    if not n or not n.chunked_text:
-        logger.warning(f"Chunked text not found for {message_id}")
+    logger.info("Fetching chunked text for %s", message_id)
+    chunks = (
+        db.query(Newsletter.chunked_text)
+        .filter(Newsletter.message_id == message_id)
+        .scalar()
+    )
+    if not chunks:
+        logger.warning("Chunked text not found for %s", message_id)
         return ApiResponse(success=False, error="Chunked text not available")
-    logger.debug(f"Returning {len(n.chunked_text)} chunks")
-    return ApiResponse(success=True, data={"chunks": n.chunked_text})
+    logger.debug("Returning %s chunks", len(chunks))
+    return ApiResponse(success=True, data={"chunks": chunks})
 
 
 # review
 @router.post("/tokenize/{message_id}", response_model=ApiResponse)
 def tokenize_newsletter(message_id: str, db: Session = Depends(get_db)):
     """Return the token count for the given newsletter."""
-    logger.info(f"Tokenizing newsletter {message_id}")
+    logger.info("Tokenizing newsletter %s", message_id)
     count = compute_token_count_simple(db, message_id)
     if count is None:
-        logger.error(f"Tokenization failed for {message_id}")
+        logger.error("Tokenization failed for %s", message_id)
         return ApiResponse(success=False, error="Tokenization failed")
-    logger.debug(f"Token count for {message_id}: {count}")
+    logger.debug("Token count for %s: %s", message_id, count)
     return ApiResponse(
         success=True, data={"message_id": message_id, "token_count": count}
     )
@@ -342,6 +416,8 @@ def extract_all_newsletters(db: Session = Depends(get_db)):
             logger.exception("Failed to extract %s", n.message_id)
             continue
     logger.info("Extracted %d newsletters", len(processed))
+    if processed:
+        _invalidate_categories()
     return ApiResponse(success=True, data={"count": len(processed), "ids": processed})
 
 
@@ -372,4 +448,6 @@ def vectorize_all_newsletters(db: Session = Depends(get_db)):
             logger.exception("Failed to vectorize %s", n.message_id)
             continue
     logger.info("Vectorized %d newsletters", len(processed))
+    if processed:
+        _invalidate_categories()
     return ApiResponse(success=True, data={"count": len(processed), "ids": processed})
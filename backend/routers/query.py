@@ -21,9 +21,9 @@ class ContextPayload(BaseModel):
     message_ids: list[str] | None = None
 
 @router.post("/ask", response_model=ApiResponse)
-async def ask(payload: AskPayload):
+def ask(payload: AskPayload):
     logger.info(
-        f"Received /ask with query='{payload.query}' mode='{payload.mode}'"
+        "Received /ask with query='%s' mode='%s'", payload.query, payload.mode
     )
     try:
         if payload.mode == "rag":
@@ -34,7 +34,7 @@ async def ask(payload: AskPayload):
             try:
                 system_prompt = load_system_prompt()
             except Exception as perr:
-                logger.error(f"Failed to load system prompt: {perr}")
+                logger.error("Failed to load system prompt: %s", perr)
                 return ApiResponse(success=False, error="Server missing SystemPrompt.txt. Contact admin.")
 
             messages = [
@@ -51,13 +51,13 @@ async def ask(payload: AskPayload):
                 llm = LocalLLMClient()
                 llm_reply = llm.complete_chat(messages, max_tokens=512)
             except Exception as llm_err:
-                logger.error(f"Local LLM call failed: {llm_err}")
+                logger.error("Local LLM call failed: %s", llm_err)
                 llm_reply = f"[LLM ERROR: {llm_err}]"
-            logger.info(f"LLM reply length: {len(llm_reply) if llm_reply else 0}")
+            logger.info("LLM reply length: %s", len(llm_reply) if llm_reply else 0)
             return ApiResponse(success=True, data={"reply": llm_reply, "source": "rag+local-llm"})
 
         reply = f"You asked: {payload.query}"
-        logger.debug(f"Reply generated: {reply}")
+        logger.debug("Reply generated: %s", reply)
         return ApiResponse(
             success=True, data={"reply": reply, "source": payload.mode or "llm"}
         )
@@ -66,9 +66,9 @@ async def ask(payload: AskPayload):
         return ApiResponse(success=False, error=str(e))
 
 @router.post("/context", response_model=ApiResponse)
-async def context_search(payload: ContextPayload):
+def context_search(payload: ContextPayload):
     logger.info(
-        f"Received /context query='{payload.query}' categories={payload.categories}"
+        "Received /context query='%s' categories=%s", payload.query, payload.categories
     )
     docs = retrieve_context(
         query=payload.query,
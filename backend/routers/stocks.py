@@ -113,7 +113,7 @@ def get_available_symbols():
     logger.info("Fetching available stock symbols")
     try:
         symbols = get_available_stocks()
-        logger.debug(f"Found {len(symbols)} symbols")
+        logger.debug("Found %s symbols", len(symbols))
         return ApiResponse(success=True, data=symbols)
     except Exception as e:
         logger.exception("Failed to fetch available symbols")
@@ -127,13 +127,13 @@ def get_daily_data(
     end_date: str | None = Query(None)
 ):
     """Get daily OHLCV data for a symbol."""
-    logger.info(f"Fetching daily data for {symbol}")
+    logger.info("Fetching daily data for %s", symbol)
     try:
         data = load_daily_stock_data(symbol, start_date, end_date)
-        logger.debug(f"Returning {len(data)} daily records for {symbol}")
+        logger.debug("Returning %s daily records for %s", len(data), symbol)
         return ApiResponse(success=True, data=data)
     except Exception as e:
-        logger.exception(f"Failed to fetch daily data for {symbol}")
+        logger.exception("Failed to fetch daily data for %s", symbol)
         return ApiResponse(success=False, error=str(e))
 
 
@@ -144,23 +144,23 @@ def get_intraday_data(
     end_date: str | None = Query(None)
 ):
     """Get 5-minute OHLCV data for a symbol."""
-    logger.info(f"Fetching intraday data for {symbol}")
+    logger.info("Fetching intraday data for %s", symbol)
     try:
         data = load_intraday_stock_data(symbol, start_date, end_date)
-        logger.debug(f"Returning {len(data)} intraday records for {symbol}")
+        logger.debug("Returning %s intraday records for %s", len(data), symbol)
         return ApiResponse(success=True, data=data)
     except Exception as e:
-        logger.exception(f"Failed to fetch intraday data for {symbol}")
+        logger.exception("Failed to fetch intraday data for %s", symbol)
         return ApiResponse(success=False, error=str(e))
 
 
 @router.get("/data/{symbol}/{date}", response_model=ApiResponse)
 def get_stock_data_by_date(symbol: str, date: str):
     """Get both daily and intraday data for a symbol on a specific date."""
-    logger.info(f"Fetching stock data for {symbol} on {date}")
+    logger.info("Fetching stock data for %s on %s", symbol, date)
     try:
         data = get_stock_data_for_date(symbol, date)
         return ApiResponse(success=True, data=data)
     except Exception as e:
-        logger.exception(f"Failed to fetch stock data for {symbol} on {date}")
+        logger.exception("Failed to fetch stock data for %s on %s", symbol, date)
         return ApiResponse(success=False, error=str(e))
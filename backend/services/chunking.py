@@ -6,6 +6,7 @@ from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 from ..models import Newsletter
+from .queries import get_newsletter
 from .cleaning import clean_bloomberg_newsletter
 
 
@@ -26,7 +27,7 @@ def chunk_newsletter_text(
         chunk_overlap,
     )
     try:
-        newsletter = db.query(Newsletter).filter_by(message_id=message_id).first()
+        newsletter = get_newsletter(db, message_id)
         if not newsletter:
             logger.warning("No newsletter found with message_id: %s", message_id)
             return None
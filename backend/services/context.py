@@ -74,5 +74,5 @@ def retrieve_context(
         return filtered
 
     except Exception as e:
-        logging.exception(f"Failed to retrieve context for query: {query}")
+        logging.exception("Failed to retrieve context for query: %s", query)
         return []
\ No newline at end of file
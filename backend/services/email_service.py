@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session
 from ..database import get_db
 from ..env import GMAIL_CREDENTIALS_FILE, GMAIL_SCOPE, GMAIL_TOKEN_FILE
 from ..models import Newsletter
+from .queries import get_newsletter
 
 SCOPES = [GMAIL_SCOPE]
 
@@ -32,7 +33,7 @@ def get_authenticated_gmail_service():
             with open(GMAIL_TOKEN_FILE, "rb") as token:
                 creds = pickle.load(token)
         except Exception as e:
-            logging.error(f"Failed to load token: {e}")
+            logging.error("Failed to load token: %s", e)
             creds = None
 
     # Step 2: Refresh or delete invalid token
@@ -40,7 +41,7 @@ def get_authenticated_gmail_service():
         try:
             creds.refresh(Request())
         except Exception as e:
-            logging.error(f"Token refresh failed: {e}, deleting token.")
+            logging.error("Token refresh failed: %s, deleting token.", e)
             os.remove(GMAIL_TOKEN_FILE)
             return get_authenticated_gmail_service()
 
@@ -60,11 +61,11 @@ def get_authenticated_gmail_service():
                 pickle.dump(creds, token)
 
         except Exception as e:
-            logging.error(f"OAuth flow failed: {e}")
+            logging.error("OAuth flow failed: %s", e)
             return None
 
-    logging.info(f"Credentials valid: {getattr(creds, 'valid', False)}")
-    logging.info(f"Credential scopes: {getattr(creds, 'scopes', [])}")
+    logging.info("Credentials valid: %s", getattr(creds, "valid", False))
+    logging.info("Credential scopes: %s", getattr(creds, "scopes", []))
 
     # Step 4: Return Gmail service
     try:
@@ -78,11 +79,12 @@ def get_authenticated_gmail_service():
         logging.debug("Gmail service successfully built")
         return service
     except Exception as e:
-        logging.exception(f"Failed to build Gmail service: {e}")
+        logging.exception("Failed to build Gmail service: %s", e)
         return None
 
 
 def scan_bloomberg_emails(service, db: Session):
+    """Store metadata for new Bloomberg emails and return their message ids."""
     logging.info("Starting scan_bloomberg_emails")
     logging.debug("Service: %s, DB Session: %s", service, db)
     try:
@@ -94,7 +96,7 @@ def scan_bloomberg_emails(service, db: Session):
             .execute()
         )
         messages = results.get("messages", [])
-        logging.debug(f"Found {len(messages)} messages")
+        logging.debug("Found %s messages", len(messages))
         if not messages:
             logging.info("No Bloomberg emails found.")
             return []
@@ -103,11 +105,11 @@ def scan_bloomberg_emails(service, db: Session):
 
         for msg_meta in messages:
             msg_id = msg_meta["id"]
-            logging.debug(f"Processing message {msg_id}")
+            logging.debug("Processing message %s", msg_id)
 
             # Skip if already exists
-            if db.query(Newsletter).filter_by(message_id=msg_id).first():
-                logging.debug(f"Skipping {msg_id}, already in DB")
+            if get_newsletter(db, msg_id):
+                logging.debug("Skipping %s, already in DB", msg_id)
                 continue
 
             msg = (
@@ -137,7 +139,9 @@ def scan_bloomberg_emails(service, db: Session):
                                 "utf-8", errors="replace"
                             )
                         except Exception as e:
-                            logging.warning(f"Failed to decode message {msg_id}: {e}")
+                            logging.warning(
+                                "Failed to decode message %s: %s", msg_id, e
+                            )
                         break
 
             if body:
@@ -158,12 +162,12 @@ def scan_bloomberg_emails(service, db: Session):
                 token_count=None,
             )
             db.add(newsletter)
-            stored.append(newsletter)
-            logging.debug(f"Stored metadata for {msg_id}")
+            stored.append(msg_id)
+            logging.debug("Stored metadata for %s", msg_id)
 
         db.commit()
-        logging.info(f"scan_bloomberg_emails stored {len(stored)} new newsletters")
-        logging.debug("Stored entries: %s", [n.message_id for n in stored])
+        logging.info("scan_bloomberg_emails stored %s new newsletters", len(stored))
+        logging.debug("Stored entries: %s", stored)
         return stored
 
     except Exception as e:
@@ -182,15 +186,16 @@ def fetch_raw_email(service, message_id: str):
             .get(userId="me", id=message_id, format="full")
             .execute()
         )
-        logging.info(f"Fetched raw message for {message_id}")
-        logging.info(
-            "Gmail API response for %s: %s",
-            message_id,
-            json.dumps(msg, indent=2)[:1000],
-        )
+        logging.info("Fetched raw message for %s", message_id)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(
+                "Gmail API response for %s: %s",
+                message_id,
+                json.dumps(msg, separators=(",", ":"))[:1000],
+            )
         return msg
     except Exception:
-        logging.exception(f"Failed to fetch raw message for {message_id}")
+        logging.exception("Failed to fetch raw message for %s", message_id)
         return None
 
 
@@ -237,7 +242,7 @@ def find_largest_text_plain_part(payload):
 
 def log_mime_structure(payload, depth=0):
     indent = "  " * depth
-    logging.debug(f"{indent}- {payload.get('mimeType', 'unknown')}")
+    logging.debug("%s- %s", indent, payload.get("mimeType", "unknown"))
     for part in payload.get("parts", []):
         log_mime_structure(part, depth + 1)
 
@@ -245,12 +250,16 @@ def log_mime_structure(payload, depth=0):
 def extract_bloomberg_email_text(service, db: Session, message_id: str):
     logging.debug("Extracting newsletter text for %s", message_id)
     try:
-        newsletter = db.query(Newsletter).filter_by(message_id=message_id).first()
+        newsletter = get_newsletter(db, message_id)
         if not newsletter:
-            logging.warning(f"No newsletter entry found for message_id: {message_id}")
+            logging.warning(
+                "No newsletter entry found for message_id: %s", message_id
+            )
             return None
         if newsletter.extracted_text:
-            logging.info(f"extracted_text already exists for message_id: {message_id}")
+            logging.info(
+                "extracted_text already exists for message_id: %s", message_id
+            )
             return newsletter
 
         msg = (
@@ -262,7 +271,8 @@ def extract_bloomberg_email_text(service, db: Session, message_id: str):
         payload = msg.get("payload", {})
         headers = {h["name"]: h["value"] for h in payload.get("headers", [])}
 
-        log_mime_structure(payload)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            log_mime_structure(payload)
 
         body = ""
         # Prefer the largest text/plain part in case of multiple alternatives
@@ -273,14 +283,16 @@ def extract_bloomberg_email_text(service, db: Session, message_id: str):
                 raw_bytes = base64.urlsafe_b64decode(data)
                 body = quopri.decodestring(raw_bytes).decode("utf-8", errors="replace")
             except Exception as e:
-                logging.warning(f"Failed to decode body of {message_id}: {e}")
+                logging.warning("Failed to decode body of %s: %s", message_id, e)
                 return None
         else:
-            logging.warning(f"No text/plain part found in message {message_id}")
+            logging.warning("No text/plain part found in message %s", message_id)
             return None
 
         if not body:
-            logging.warning(f"No text/plain body found for message_id: {message_id}")
+            logging.warning(
+                "No text/plain body found for message_id: %s", message_id
+            )
             return None
 
         # Remove any header metadata that might be embedded in the part
@@ -301,7 +313,7 @@ def extract_bloomberg_email_text(service, db: Session, message_id: str):
 
         extracted_text = "\n".join(content_lines).strip()
         if not extracted_text:
-            logging.warning(f"No content extracted for {message_id}")
+            logging.warning("No content extracted for %s", message_id)
             return None
 
         newsletter.extracted_text = extracted_text
@@ -311,7 +323,7 @@ def extract_bloomberg_email_text(service, db: Session, message_id: str):
         # Derive category from stored extracted_text if missing
         if newsletter.category is None and newsletter.extracted_text:
             logging.debug(
-                f"Deriving category from stored text for {newsletter.message_id}"
+                "Deriving category from stored text for %s", newsletter.message_id
             )
             for line in newsletter.extracted_text.splitlines():
                 line = line.strip()
@@ -320,17 +332,19 @@ def extract_bloomberg_email_text(service, db: Session, message_id: str):
                     db.commit()
                     db.refresh(newsletter)
                     logging.debug(
-                        f"Backfilled category '{newsletter.category}' for {newsletter.message_id}"
+                        "Backfilled category '%s' for %s",
+                        newsletter.category,
+                        newsletter.message_id,
                     )
                     break
 
-        logging.info(f"Extracted and updated content for message_id: {message_id}")
+        logging.info("Extracted and updated content for message_id: %s", message_id)
         logging.debug("Stored text length for %s: %d", message_id, len(extracted_text))
         return newsletter
 
     except Exception as e:
         db.rollback()
-        logging.exception(f"Error extracting text for message_id: {message_id}")
+        logging.exception("Error extracting text for message_id: %s", message_id)
         return None
 
 
@@ -348,7 +362,7 @@ def backfill_categories_from_text(db: Session):
         .all()
     )
 
-    logging.debug(f"{len(newsletters)} newsletters need category backfill from text")
+    logging.debug("%s newsletters need category backfill from text", len(newsletters))
 
     for newsletter in newsletters:
         try:
@@ -358,12 +372,14 @@ def backfill_categories_from_text(db: Session):
                     category = line.lower().replace(" ", "_")
                     newsletter.category = category
                     logging.debug(
-                        f"Backfilled category '{category}' for message {newsletter.message_id}"
+                        "Backfilled category '%s' for message %s",
+                        category,
+                        newsletter.message_id,
                     )
                     break
         except Exception as e:
             logging.warning(
-                f"Failed to backfill for message {newsletter.message_id}: {e}"
+                "Failed to backfill for message %s: %s", newsletter.message_id, e
             )
             continue
 
@@ -41,7 +41,7 @@ def save_prices_to_cache(prices: dict) -> None:
         with open(CACHE_FILE, "w") as f:
             json.dump(prices, f)
     except Exception as e:
-        logger.warning(f"Failed to write cache: {e}")
+        logger.warning("Failed to write cache: %s", e)
 
 
 def load_thread_info() -> dict:
@@ -62,7 +62,7 @@ def save_thread_info(thread_id: str, message_id: str) -> None:
         with open(THREAD_FILE, "w") as f:
             json.dump({"thread_id": thread_id, "message_id": message_id}, f)
     except Exception as e:
-        logger.warning(f"Failed to write thread info: {e}")
+        logger.warning("Failed to write thread info: %s", e)
 
 
 def _format_prices(previous_prices: dict, current_prices: dict) -> str:
@@ -160,7 +160,7 @@ def send_price_email(tickers: str | None = None, recipient: str | None = None) -
         logger.exception("Failed to send stock price email")
         return False
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         return False
 
 
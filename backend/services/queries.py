@@ -0,0 +1,23 @@
+"""Precompiled lookups shared by the newsletter services and routers."""
+
+from __future__ import annotations
+
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.orm import Session
+
+from ..models import Newsletter
+
+# Built once at import so every lookup hits the same compiled-cache entry
+# instead of rebuilding the query object per call.
+_newsletter_by_message_id = lambda_stmt(
+    lambda: select(Newsletter).where(Newsletter.message_id == bindparam("message_id"))
+)
+
+
+def get_newsletter(db: Session, message_id: str) -> Newsletter | None:
+    """Return the newsletter stored under ``message_id`` or ``None``."""
+    return (
+        db.execute(_newsletter_by_message_id, {"message_id": message_id})
+        .scalars()
+        .first()
+    )
@@ -35,12 +35,17 @@ COMPANIES: Dict[str, Dict[str, str]] = {
 
 SEC_HEADERS = {"User-Agent": SEC_USER_AGENT}
 
+# One keep-alive session for the monitor loop so each poll reuses the TLS
+# connection to data.sec.gov instead of handshaking per CIK.
+_http = requests.Session()
+_http.headers.update(SEC_HEADERS)
+
 
 def fetch_latest_form4(cik: str) -> Optional[Dict[str, str]]:
     """Return metadata for the latest Form 4 filing for the given CIK."""
     url = f"https://data.sec.gov/submissions/CIK{cik.zfill(10)}.json"
     try:
-        resp = requests.get(url, headers=SEC_HEADERS, timeout=10)
+        resp = _http.get(url, timeout=10)
         data = resp.json()
         recent = data.get("filings", {}).get("recent", {})
         forms = recent.get("form", [])
@@ -54,11 +54,13 @@ def _aggregate_daily_from_5min(symbol: str) -> List[Dict[str, Any]]:
                 'source': '5_min_aggregated'
             })
         
-        logger.debug(f"Aggregated {len(result)} daily records from 5_min data for {symbol}")
+        logger.debug(
+            "Aggregated %s daily records from 5_min data for %s", len(result), symbol
+        )
         return result
         
     except Exception as e:
-        logger.error(f"Error aggregating 5_min data for {symbol}: {e}")
+        logger.error("Error aggregating 5_min data for %s: %s", symbol, e)
         return []
 
 def get_available_stocks() -> List[str]:
@@ -92,7 +94,7 @@ def get_available_stocks() -> List[str]:
         
         return sorted(list(stocks))
     except Exception as e:
-        logger.error(f"Error getting available stocks: {e}")
+        logger.error("Error getting available stocks: %s", e)
         return []
 
 def load_daily_stock_data(symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -117,7 +119,7 @@ def load_daily_stock_data(symbol: str, start_date: Optional[str] = None, end_dat
         all_data.extend(five_min_daily)
         
         if not all_data:
-            logger.warning(f"No data found for {symbol}")
+            logger.warning("No data found for %s", symbol)
             return []
         
         # Remove duplicates by date and sort (prioritize source order: daily_ > root > 5_min)
@@ -150,11 +152,11 @@ def load_daily_stock_data(symbol: str, start_date: Optional[str] = None, end_dat
         # Sort by date (most recent first)
         unique_data.sort(key=lambda x: x['date'], reverse=True)
         
-        logger.debug(f"Loaded {len(unique_data)} daily records for {symbol}")
+        logger.debug("Loaded %s daily records for %s", len(unique_data), symbol)
         return unique_data
         
     except Exception as e:
-        logger.error(f"Error loading daily data for {symbol}: {e}")
+        logger.error("Error loading daily data for %s: %s", symbol, e)
         return []
 
 def _process_daily_dataframe(df: pd.DataFrame, symbol: str, source: str) -> List[Dict[str, Any]]:
@@ -167,7 +169,7 @@ def _process_daily_dataframe(df: pd.DataFrame, symbol: str, source: str) -> List
         elif 'Datetime' in df.columns:
             date_col = 'Datetime'
         else:
-            logger.error(f"No Date or Datetime column found in {symbol} {source}")
+            logger.error("No Date or Datetime column found in %s %s", symbol, source)
             return []
         
         # Convert date column to datetime
@@ -197,11 +199,11 @@ def _process_daily_dataframe(df: pd.DataFrame, symbol: str, source: str) -> List
                 "volume": int(row["Volume"]) if pd.notna(row["Volume"]) else 0
             })
         
-        logger.debug(f"Processed {len(result)} records from {symbol} {source}")
+        logger.debug("Processed %s records from %s %s", len(result), symbol, source)
         return result
         
     except Exception as e:
-        logger.error(f"Error processing {symbol} {source}: {e}")
+        logger.error("Error processing %s %s: %s", symbol, source, e)
         return []
 
 def load_intraday_stock_data(symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -213,16 +215,16 @@ def load_intraday_stock_data(symbol: str, start_date: Optional[str] = None, end_
         intraday_file = INTRADAY_DATA_DIR / f"{symbol}.csv"
         if intraday_file.exists():
             df = pd.read_csv(intraday_file)
-            logger.debug(f"Loaded 5-min data from {intraday_file}")
+            logger.debug("Loaded 5-min data from %s", intraday_file)
         else:
             # Fallback to intraday folder (1-minute data)
             intraday_folder_file = INTRADAY_FOLDER / f"intraday_{symbol}.csv"
             if intraday_folder_file.exists():
                 df = pd.read_csv(intraday_folder_file)
-                logger.debug(f"Loaded 1-min data from {intraday_folder_file}")
+                logger.debug("Loaded 1-min data from %s", intraday_folder_file)
         
         if df is None:
-            logger.warning(f"No intraday data file found for {symbol}")
+            logger.warning("No intraday data file found for %s", symbol)
             return []
         
         # Convert datetime column
@@ -255,11 +257,11 @@ def load_intraday_stock_data(symbol: str, start_date: Optional[str] = None, end_
                 "volume": int(row["Volume"]) if pd.notna(row["Volume"]) else 0
             })
         
-        logger.debug(f"Loaded {len(result)} intraday records for {symbol}")
+        logger.debug("Loaded %s intraday records for %s", len(result), symbol)
         return result
         
     except Exception as e:
-        logger.error(f"Error loading intraday data for {symbol}: {e}")
+        logger.error("Error loading intraday data for %s: %s", symbol, e)
         return []
 
 def get_stock_data_for_date(symbol: str, target_date: str) -> Dict[str, Any]:
@@ -279,7 +281,9 @@ def get_stock_data_for_date(symbol: str, target_date: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Error getting stock data for {symbol} on {target_date}: {e}")
+        logger.error(
+            "Error getting stock data for %s on %s: %s", symbol, target_date, e
+        )
         return {
             "symbol": symbol,
             "date": target_date,
@@ -6,7 +6,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from ..env import MODEL_IN_USE
-from ..models import Newsletter
+from .queries import get_newsletter
 
 MODEL = MODEL_IN_USE
 logger = logging.getLogger(__name__)
@@ -29,7 +29,7 @@ def compute_token_count_simple(
         except KeyError:
             tokenizer = tiktoken.get_encoding("cl100k_base")
 
-        newsletter = db.query(Newsletter).filter_by(message_id=message_id).first()
+        newsletter = get_newsletter(db, message_id)
         if not newsletter:
             logger.warning("No newsletter found with message_id: %s", message_id)
             return None
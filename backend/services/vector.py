@@ -7,7 +7,7 @@ from langchain_community.vectorstores import FAISS
 from sqlalchemy.orm import Session
 
 from ..env import EMBEDDING_DEVICE, FAISS_STORE_DIR
-from ..models import Newsletter
+from .queries import get_newsletter
 from .utils import load_embedding_model
 
 
@@ -21,13 +21,14 @@ def embed_chunked_newsletter(
         persist_dir,
     )
     try:
-        newsletter = db.query(Newsletter).filter_by(message_id=message_id).first()
+        newsletter = get_newsletter(db, message_id)
         if not newsletter:
-            logging.warning(f"No newsletter found with message_id: {message_id}")
+            logging.warning("No newsletter found with message_id: %s", message_id)
             return None
         if not newsletter.chunked_text:
             logging.warning(
-                f"Newsletter with message_id {message_id} has no chunked text to embed."
+                "Newsletter with message_id %s has no chunked text to embed.",
+                message_id,
             )
             return None
         if not isinstance(newsletter.chunked_text, list) or not all(
@@ -75,20 +76,22 @@ def embed_chunked_newsletter(
         index_path.mkdir(parents=True, exist_ok=True)
         vector_db.save_local(persist_dir)
         if not (index_path / "index.faiss").exists():
-            logging.error(f"FAISS index file not found in {persist_dir}")
+            logging.error("FAISS index file not found in %s", persist_dir)
             return None
-        logging.info(f"Embedded newsletter {message_id} stored in {persist_dir}")
+        logging.info("Embedded newsletter %s stored in %s", message_id, persist_dir)
 
         newsletter.vectorized = True
         db.commit()
         db.refresh(newsletter)
 
         logging.info(
-            f"Successfully embedded and stored newsletter {message_id} into {persist_dir}"
+            "Successfully embedded and stored newsletter %s into %s",
+            message_id,
+            persist_dir,
         )
         logger.debug("FAISS files stored under %s", persist_dir)
         return vector_db
 
     except Exception as e:
-        logging.exception(f"Error embedding newsletter {message_id}: {e}")
+        logging.exception("Error embedding newsletter %s: %s", message_id, e)
         return None
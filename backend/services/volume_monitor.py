@@ -105,7 +105,7 @@ def save_alerted_volumes(alerts: dict) -> None:
         with open(ALERT_FILE, "w") as f:
             json.dump(serializable, f)
     except Exception as e:
-        logger.warning(f"Failed to write alert file: {e}")
+        logger.warning("Failed to write alert file: %s", e)
 
 
 def load_thread_info() -> dict:
@@ -126,7 +126,7 @@ def save_thread_info(info: dict) -> None:
         with open(THREAD_FILE, "w") as f:
             json.dump(info, f)
     except Exception as e:
-        logger.warning(f"Failed to write volume thread file: {e}")
+        logger.warning("Failed to write volume thread file: %s", e)
 
 
 def send_volume_email(
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from backend import database, models  # noqa: F401 - registers tables on Base
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    monkeypatch.setattr(database, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def create_all_calls(monkeypatch):
+    calls = []
+    original = database.Base.metadata.create_all
+
+    def spy(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(database.Base.metadata, "create_all", spy)
+    return calls
+
+
+def _index_names(engine, table):
+    return {i["name"] for i in inspect(engine).get_indexes(table)}
+
+
+def test_create_tables_skips_when_hash_unchanged(engine, create_all_calls):
+    database.create_tables()
+    database.create_tables()
+    assert len(create_all_calls) == 1
+    assert "newsletter" in inspect(engine).get_table_names()
+
+
+def test_create_tables_adds_missing_index_after_model_change(engine, create_all_calls):
+    database.create_tables()
+    # Simulate a database created before ix_newsletter_received was declared.
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_newsletter_received"))
+        conn.execute(text("UPDATE _schema_version SET hash = 'previous'"))
+
+    database.create_tables()
+    assert len(create_all_calls) == 2
+    assert "ix_newsletter_received" in _index_names(engine, "newsletter")
+
+
+def test_create_tables_recreates_dropped_table(engine, create_all_calls):
+    database.create_tables()
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE sec_filing"))
+
+    database.create_tables()
+    assert len(create_all_calls) == 2
+    assert "sec_filing" in inspect(engine).get_table_names()
+
+
+def test_schema_hash_tracks_constraints(monkeypatch):
+    before = database._schema_hash()
+    unique = next(
+        c
+        for c in models.SecFiling.__table__.constraints
+        if c.__class__.__name__ == "UniqueConstraint"
+    )
+    monkeypatch.setattr(unique, "name", "uq_sec_filing_renamed")
+    assert database._schema_hash() != before
+
+
+def test_create_tables_drops_obsolete_indexes(engine):
+    database.create_tables()
+    with engine.begin() as conn:
+        conn.execute(text("CREATE INDEX ix_newsletter_id ON newsletter (id)"))
+        conn.execute(text("UPDATE _schema_version SET hash = 'previous'"))
+
+    database.create_tables()
+    assert "ix_newsletter_id" not in _index_names(engine, "newsletter")
+
+
+@pytest.mark.parametrize("value", [{1: "a"}, {"n": 2**70 + 1}, ["c1", "c2"]])
+def test_json_serializer_accepts_what_json_accepts(value):
+    if database.orjson is None:
+        pytest.skip("orjson not installed")
+    assert json.loads(database._orjson_dumps(value)) == json.loads(json.dumps(value))
@@ -0,0 +1,148 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event, null
+from sqlalchemy.orm import sessionmaker
+
+from backend import main  # noqa: F401 - loads the routers without a circular import
+from backend.models import Base, Newsletter
+from backend.routers import ingest
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_categories_cache():
+    # The cache is module-global; never let one test's engine leak into another
+    ingest._invalidate_categories()
+    yield
+    ingest._invalidate_categories()
+
+
+@pytest.fixture
+def statements(db_session):
+    executed = []
+    event.listen(
+        db_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: executed.append(statement),
+    )
+    return executed
+
+
+def _newsletter(message_id, day, **fields):
+    return Newsletter(
+        title=message_id,
+        sender="noreply@news.bloomberg.com",
+        received_at=datetime(2024, 5, day),
+        message_id=message_id,
+        **fields,
+    )
+
+
+def test_reload_flags_only_chunked_rows(monkeypatch, db_session):
+    db_session.add_all(
+        [
+            # scan_bloomberg_emails sets chunked_text=None -> JSON 'null'
+            _newsletter("scanned", 1, extracted_text=None, chunked_text=None),
+            _newsletter("sql_null", 2, chunked_text=null()),
+            _newsletter("empty", 3, extracted_text="body", chunked_text=[]),
+            _newsletter("chunked", 4, extracted_text="body", chunked_text=["c1"]),
+        ]
+    )
+    db_session.commit()
+    monkeypatch.setattr(ingest.main, "gmail_service", object())
+    monkeypatch.setattr(ingest, "scan_bloomberg_emails", lambda service, db: [])
+
+    response = ingest.reload_bloomberg_emails(db=db_session)
+
+    assert response.success
+    flags = {row["message_id"]: (row["has_text"], row["has_chunks"]) for row in response.data}
+    assert flags == {
+        "scanned": (False, False),
+        "sql_null": (False, False),
+        "empty": (True, False),
+        "chunked": (True, True),
+    }
+    assert [row["message_id"] for row in response.data] == [
+        "chunked",
+        "empty",
+        "sql_null",
+        "scanned",
+    ]
+
+
+def test_categories_served_from_cache_within_ttl(db_session, statements):
+    db_session.add(_newsletter("a", 1, category="markets"))
+    db_session.commit()
+
+    assert ingest.get_categories(db=db_session).data == ["markets"]
+    queries = len(statements)
+    db_session.add(_newsletter("b", 2, category="economics"))
+    db_session.commit()
+    statements.clear()
+
+    assert ingest.get_categories(db=db_session).data == ["markets"]
+    assert statements == []
+    assert queries > 0
+
+
+def test_categories_refresh_after_invalidate_or_ttl(monkeypatch, db_session):
+    now = [100.0]
+    monkeypatch.setattr(ingest.time, "monotonic", lambda: now[0])
+    db_session.add(_newsletter("a", 1, category="markets"))
+    db_session.commit()
+    assert ingest.get_categories(db=db_session).data == ["markets"]
+
+    db_session.add(_newsletter("b", 2, category="economics"))
+    db_session.commit()
+    ingest._invalidate_categories()
+    assert sorted(ingest.get_categories(db=db_session).data) == ["economics", "markets"]
+
+    db_session.add(_newsletter("c", 3, category="politics"))
+    db_session.commit()
+    assert len(ingest.get_categories(db=db_session).data) == 2
+    now[0] += ingest.CATEGORIES_TTL + 1
+    assert len(ingest.get_categories(db=db_session).data) == 3
+
+
+def test_categories_query_racing_an_invalidation_is_not_cached(db_session):
+    db_session.add(_newsletter("a", 1, category="markets"))
+    db_session.commit()
+
+    # Invalidate while the SELECT DISTINCT is in flight, as a concurrent
+    # bloomberg_reload would from another threadpool worker.
+    event.listen(
+        db_session.get_bind(),
+        "after_cursor_execute",
+        lambda *args: ingest._invalidate_categories(),
+        once=True,
+    )
+    assert ingest.get_categories(db=db_session).data == ["markets"]
+    assert ingest._categories_cache is None
+
+
+def test_reload_invalidates_categories_when_rows_are_stored(monkeypatch, db_session):
+    db_session.add(_newsletter("a", 1, category="markets"))
+    db_session.commit()
+    assert ingest.get_categories(db=db_session).data == ["markets"]
+
+    def fake_scan(service, db):
+        db.add(_newsletter("b", 2, category="economics"))
+        db.commit()
+        return ["b"]
+
+    monkeypatch.setattr(ingest.main, "gmail_service", object())
+    monkeypatch.setattr(ingest, "scan_bloomberg_emails", fake_scan)
+    assert ingest.reload_bloomberg_emails(db=db_session).success
+    assert sorted(ingest.get_categories(db=db_session).data) == ["economics", "markets"]
@@ -0,0 +1,177 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from hitherto import llm
+from hitherto.llm import HithertoLLM, LLMProvider, ResponseCache, SQLiteResponseCache
+
+
+class EchoProvider(LLMProvider):
+    """Returns the prompt with a call counter so repeated calls are visible."""
+
+    def __init__(self, delays=None, **config):
+        super().__init__("echo-1", **config)
+        self.calls = 0
+        self.delays = delays or {}
+
+    async def send_prompt(self, messages, context=None, **kwargs):
+        self.calls += 1
+        prompt = messages[-1].content
+        await asyncio.sleep(self.delays.get(prompt, 0))
+        return f"{prompt}#{self.calls}"
+
+    def format_context(self, context):
+        return str(context.context_data)
+
+
+def _llm(cache=None, **config):
+    h = HithertoLLM(cache=cache or ResponseCache())
+    provider = EchoProvider(**config)
+    h.register_provider("echo", provider)
+    return h, provider
+
+
+def test_low_temperature_request_is_served_from_cache():
+    h, provider = _llm(temperature=0.0)
+    first = asyncio.run(h.reason("hi"))
+    second = asyncio.run(h.reason("hi"))
+    assert first == second == "hi#1"
+    assert provider.calls == 1
+    assert h.get_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_different_params_miss():
+    h, provider = _llm(temperature=0.0)
+    asyncio.run(h.reason("hi"))
+    asyncio.run(h.reason("hi", max_tokens=10))
+    assert provider.calls == 2
+
+
+@pytest.mark.parametrize(
+    "config,kwargs",
+    [
+        ({}, {}),  # temperature unknown
+        ({"temperature": 0.7}, {}),
+        ({"temperature": 0.0}, {"temperature": 0.9}),
+        ({"temperature": 0.0}, {"use_cache": False}),
+    ],
+)
+def test_request_bypasses_cache(config, kwargs):
+    h, provider = _llm(**config)
+    asyncio.run(h.reason("hi", **kwargs))
+    asyncio.run(h.reason("hi", **kwargs))
+    assert provider.calls == 2
+    assert h.get_cache_stats()["size"] == 0
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=10.0)
+    cache.update("k", "v")
+    now[0] += 9.0
+    assert cache.lookup("k") == "v"
+    now[0] += 11.0
+    assert cache.lookup("k") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    cache.update("a", "1")
+    cache.update("b", "2")
+    assert cache.lookup("a") == "1"  # "b" is now least recently used
+    cache.update("c", "3")
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == "1"
+    assert cache.lookup("c") == "3"
+
+
+def test_reason_batch_preserves_job_order():
+    h, _ = _llm(delays={"slow": 0.05, "fast": 0})
+    jobs = [{"prompt": "slow"}, {"prompt": "fast"}]
+    results = asyncio.run(h.reason_batch(jobs))
+    assert [r.split("#")[0] for r in results] == ["slow", "fast"]
+
+
+def test_make_key_accepts_non_string_keys():
+    msgs = [llm.create_message("user", "hi", tags={1: "x"})]
+    key = ResponseCache.make_key("echo", "echo-1", msgs, {"logit_bias": {42: -1}})
+    again = ResponseCache.make_key("echo", "echo-1", msgs, {"logit_bias": {42: -1}})
+    other = ResponseCache.make_key("echo", "echo-1", msgs, {"logit_bias": {42: 1}})
+    assert key == again != other
+
+
+def test_reason_with_non_string_param_keys_reaches_provider():
+    h, provider = _llm(temperature=0.0)
+    assert asyncio.run(h.reason("hi", tags={1: "x"})) == "hi#1"
+    assert asyncio.run(h.reason("hi", tags={1: "x"})) == "hi#1"
+    assert provider.calls == 1
+
+
+@pytest.mark.parametrize("params", [{"logit_bias": {(1, 2): 1}}, "circular"])
+def test_unkeyable_request_bypasses_cache(params):
+    if params == "circular":
+        loop = []
+        loop.append(loop)
+        params = {"stop": loop}
+    h, provider = _llm(temperature=0.0)
+    assert asyncio.run(h.reason("hi", **params)) == "hi#1"
+    assert asyncio.run(h.reason("hi", **params)) == "hi#2"
+    assert h.get_cache_stats()["size"] == 0
+
+
+def test_make_key_accepts_mixed_key_types():
+    msgs = [llm.create_message("user", "hi")]
+    key = ResponseCache.make_key("echo", "echo-1", msgs, {"bias": {1: "a", "b": 2}})
+    assert key == ResponseCache.make_key("echo", "echo-1", msgs, {"bias": {1: "a", "b": 2}})
+
+
+def test_sqlite_store_is_shared_across_threads_and_instances(tmp_path):
+    store = SQLiteResponseCache(str(tmp_path / "llm.db"))
+    h, _ = _llm(cache=ResponseCache(backing=store), temperature=0.0)
+    results = []
+    worker = threading.Thread(target=lambda: results.append(asyncio.run(h.reason("hi"))))
+    worker.start()
+    worker.join()
+    assert results == ["hi#1"]
+
+    fresh, provider = _llm(cache=ResponseCache(backing=store), temperature=0.0)
+    assert asyncio.run(fresh.reason("hi")) == "hi#1"
+    assert provider.calls == 0
+    store.close()
+
+
+def test_backing_store_errors_count_as_misses(tmp_path):
+    store = SQLiteResponseCache(str(tmp_path / "llm.db"))
+    store.close()  # every further query raises sqlite3.ProgrammingError
+    h, provider = _llm(cache=ResponseCache(backing=store), temperature=0.0)
+    assert asyncio.run(h.reason("hi")) == "hi#1"
+    assert h.cache.lookup("missing") is None
+    assert provider.calls == 1
+
+
+def test_sqlite_store_prunes_expired_rows_on_open(tmp_path):
+    path = str(tmp_path / "llm.db")
+    SQLiteResponseCache(path).close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO cache VALUES ('old', 'x', 0), ('new', 'y', 1e12)")
+    store = SQLiteResponseCache(path, max_age=60.0)
+    assert store.lookup("old") is None
+    assert store.lookup("new") == "y"
+    store.close()
+
+
+def test_backing_store_serves_rows_older_than_memory_ttl(tmp_path):
+    path = str(tmp_path / "llm.db")
+    SQLiteResponseCache(path).close()
+    hour_ago = llm.time.time() - 3600
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO cache VALUES ('k', 'v', ?)", (hour_ago,))
+
+    store = SQLiteResponseCache(path)  # reopened, as after a restart
+    cache = ResponseCache(ttl=600.0, backing=store)
+    assert cache.lookup("k") == "v"
+    store.close()
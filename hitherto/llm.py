@@ -6,12 +6,21 @@ Focuses on supplying structured context to LLMs for decision-making across all m
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
+import asyncio
+import hashlib
 import json
+import logging
+import sqlite3
+import threading
+import time
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMMessage:
     """Structured message for LLM communication"""
     role: str  # "system", "user", "assistant"
@@ -19,7 +28,7 @@ class LLMMessage:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMContext:
     """Structured context container for LLM reasoning"""
     module_name: str
@@ -62,6 +71,189 @@ class LLMProvider(ABC):
         pass
 
 
+class SQLiteResponseCache:
+    """Disk-backed response store shared across restarts and worker processes
+
+    One connection is shared by all threads and serialized with a lock. Rows
+    older than ``max_age`` seconds are pruned on open and every
+    ``PRUNE_EVERY`` writes so the file does not grow without bound.
+    """
+
+    PRUNE_EVERY = 256
+
+    def __init__(self, path: str = ".hitherto_llm.db", max_age: Optional[float] = 86400.0):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.prune()
+
+    def lookup(self, key: str, max_age: Optional[float] = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return row[0]
+
+    def update(self, key: str, content: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, content, created_at) VALUES (?, ?, ?)",
+                (key, content, time.time()),
+            )
+            self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete rows older than ``max_age``; returns the number removed"""
+        if self.max_age is None:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE created_at < ?", (time.time() - self.max_age,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """Exact-match LRU cache of LLM responses keyed by the full request
+
+    An optional ``backing`` store (e.g. ``SQLiteResponseCache``) sits below the
+    in-memory LRU: misses fall through to it and updates are written through.
+    ``ttl`` only bounds the in-memory entries; the backing store applies its
+    own ``max_age`` so responses survive restarts for as long as it keeps them.
+    The backing store is best-effort; its errors are logged and count as misses.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: Optional[float] = 600.0,
+        backing: Optional[SQLiteResponseCache] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backing = backing
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        provider_name: str,
+        model_name: str,
+        messages: List[LLMMessage],
+        params: Dict[str, Any],
+    ) -> str:
+        """Hash provider, model, messages and call parameters into a cache key"""
+        request = {
+            "p": provider_name,
+            "m": model_name,
+            "msgs": [(m.role, m.content, m.metadata) for m in messages],
+            "kw": params,
+        }
+        # One encoder on every worker: the SQLite store is shared, so keys must
+        # not depend on which optional JSON libraries a process has installed
+        dumps_kwargs = dict(default=str, separators=(",", ":"), ensure_ascii=False)
+        try:
+            payload = json.dumps(request, sort_keys=True, **dumps_kwargs)
+        except TypeError:  # mixed key types cannot be sorted; keep insertion order
+            payload = json.dumps(request, **dumps_kwargs)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` or ``None`` on miss/expiry"""
+        response = self._memory_lookup(key)
+        if response is None and self.backing is not None:
+            response = self._backing_lookup(key)
+        return self._record(key, response)
+
+    async def alookup(self, key: str) -> Optional[str]:
+        """``lookup`` that reads the backing store off the event loop"""
+        response = self._memory_lookup(key)
+        if response is None and self.backing is not None:
+            response = await asyncio.to_thread(self._backing_lookup, key)
+        return self._record(key, response)
+
+    def update(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key``, evicting the least recently used entry"""
+        self._remember(key, response)
+        if self.backing is not None:
+            self._backing_update(key, response)
+
+    async def aupdate(self, key: str, response: str) -> None:
+        """``update`` that writes the backing store off the event loop"""
+        self._remember(key, response)
+        if self.backing is not None:
+            await asyncio.to_thread(self._backing_update, key, response)
+
+    def _memory_lookup(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if self.ttl is None or time.monotonic() - stored_at <= self.ttl:
+                self._entries.move_to_end(key)
+                return response
+            del self._entries[key]
+            return None
+
+    def _backing_lookup(self, key: str) -> Optional[str]:
+        try:
+            response = self.backing.lookup(key, self.backing.max_age)
+        except Exception:
+            logger.warning("Response cache backing lookup failed", exc_info=True)
+            return None
+        if response is not None:
+            self._remember(key, response)
+        return response
+
+    def _backing_update(self, key: str, response: str) -> None:
+        try:
+            self.backing.update(key, response)
+        except Exception:
+            logger.warning("Response cache backing update failed", exc_info=True)
+
+    def _record(self, key: str, response: Optional[str]) -> Optional[str]:
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def _remember(self, key: str, response: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
 class HithertoLLM:
     """
     Main LLM interface for the Hitherto framework
@@ -70,9 +262,14 @@ class HithertoLLM:
     for reasoning across all modules as per the framework design.
     """
     
-    def __init__(self):
+    # Sampling above this temperature is intentionally non-deterministic,
+    # so identical prompts must not be served from the cache
+    CACHEABLE_MAX_TEMPERATURE = 0.2
+
+    def __init__(self, cache: Optional[ResponseCache] = None):
         self.providers: Dict[str, LLMProvider] = {}
         self.default_provider: Optional[str] = None
+        self.cache = cache if cache is not None else ResponseCache()
     
     def register_provider(self, name: str, provider: LLMProvider, set_as_default: bool = False):
         """Register an LLM provider"""
@@ -85,6 +282,7 @@ class HithertoLLM:
         prompt: str, 
         context: Optional[LLMContext] = None, 
         provider_name: Optional[str] = None,
+        use_cache: bool = True,
         **kwargs
     ) -> str:
         """
@@ -94,6 +292,7 @@ class HithertoLLM:
             prompt: The reasoning prompt/question
             context: Structured context for the LLM to reason about
             provider_name: Specific provider to use (defaults to configured default)
+            use_cache: Serve byte-identical low-temperature requests from the response cache
             **kwargs: Additional parameters for the provider
             
         Returns:
@@ -130,7 +329,41 @@ class HithertoLLM:
         prompt_message = LLMMessage(role="user", content=prompt)
         messages.append(prompt_message)
         
-        return await provider.send_prompt(messages, context, **kwargs)
+        cache_key = None
+        temperature = kwargs.get("temperature", provider.config.get("temperature"))
+        if (
+            use_cache
+            and temperature is not None
+            and temperature <= self.CACHEABLE_MAX_TEMPERATURE
+        ):
+            try:
+                cache_key = ResponseCache.make_key(
+                    provider_name, provider.model_name, messages, kwargs
+                )
+            except (TypeError, ValueError):  # unserializable or circular params
+                logger.debug("Request is not cacheable; calling provider directly")
+            if cache_key is not None:
+                cached = await self.cache.alookup(cache_key)
+                if cached is not None:
+                    return cached
+        
+        response = await provider.send_prompt(messages, context, **kwargs)
+        if cache_key is not None:
+            await self.cache.aupdate(cache_key, response)
+        return response
+    
+    async def reason_batch(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Run independent reasoning calls concurrently
+        
+        Args:
+            jobs: Keyword arguments for ``reason`` (prompt, context, provider_name, ...)
+            
+        Returns:
+            Responses in the same order as ``jobs``; wall time is roughly that of
+            the slowest call instead of the sum of all of them
+        """
+        return await asyncio.gather(*(self.reason(**job) for job in jobs))
     
     def get_provider(self, name: Optional[str] = None) -> LLMProvider:
         """Get a specific provider or the default"""
@@ -138,6 +371,10 @@ class HithertoLLM:
         if not provider_name or provider_name not in self.providers:
             raise ValueError(f"Provider '{provider_name}' not found")
         return self.providers[provider_name]
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Response cache hit/miss counters"""
+        return self.cache.stats()
 
 
 # Global instance for the framework
@@ -114,7 +114,7 @@ class LLMMessageLog(Base):  # type: ignore
 		UUID(as_uuid=False), primary_key=True, default=lambda: uuid4().hex
 	)
 	conversation_id: Mapped[Optional[str]] = mapped_column(
-		UUID(as_uuid=False), index=True, nullable=True
+		UUID(as_uuid=False), nullable=True
 	)
 	parent_message_id: Mapped[Optional[str]] = mapped_column(
 		UUID(as_uuid=False), ForeignKey("llm_message_log.id", ondelete="SET NULL"), nullable=True
@@ -136,7 +136,7 @@ class LLMMessageLog(Base):  # type: ignore
 		Enum(*PRIORITY_ENUM, name="priority_enum", create_type=False), nullable=True
 	)
 
-	provider_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+	provider_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 	model_name: Mapped[Optional[str]] = mapped_column(String(150), nullable=True, index=True)
 	context_module: Mapped[Optional[str]] = mapped_column(String(150), nullable=True, index=True)
 
@@ -193,6 +193,8 @@ class LLMMessageLog(Base):  # type: ignore
 		),
 		# Optional: partial index could be added via migration for assistant only rows
 		# (example shown in MIGRATION_NOTES string below)
+		# conversation_id / provider_name are leading columns of the composites
+		# above, so they carry no standalone index
 	)
 
 	def to_dict(self) -> Dict[str, Any]:  # lightweight serializer
@@ -252,6 +254,10 @@ CREATE INDEX IF NOT EXISTS ix_llm_message_log_provider_model
 	ON llm_message_log (provider_name, model_name);
 CREATE INDEX IF NOT EXISTS ix_llm_message_log_context_module
 	ON llm_message_log (context_module);
+-- Standalone indexes superseded by the composites above; databases created
+-- before they were removed still carry them
+DROP INDEX IF EXISTS ix_llm_message_log_conversation_id;
+DROP INDEX IF EXISTS ix_llm_message_log_provider_name;
 -- (Optional) GIN index on metadata for key existence / containment queries
 -- CREATE INDEX IF NOT EXISTS ix_llm_message_log_metadata ON llm_message_log USING GIN (metadata);
 -- (Optional) Partial index for recent assistant messages